@@ -18,7 +18,12 @@ from ..baseclasses import (
     UniswapSimulationResult,
 )
 from ..config import get_web3
-from ..constants import MAX_UINT256
+from ..constants import (
+    ERC20_TRANSFER_SELECTOR,
+    MAX_UINT256,
+    UNISWAP_V2_SWAP_SELECTOR,
+    UNISWAP_V3_SWAP_SELECTOR,
+)
 from ..curve.curve_stableswap_dataclasses import CurveStableswapPoolState
 from ..curve.curve_stableswap_liquidity_pool import CurveStableswapPool
 from ..erc20_token import Erc20Token
@@ -38,6 +43,13 @@ from .arbitrage_dataclasses import (
     UniswapV3PoolSwapAmounts,
 )
 
+# Function selectors for Curve payload calldata
+ERC20_APPROVE_SELECTOR = Web3.keccak(text="approve(address,uint256)")[:4]
+CURVE_V1_EXCHANGE_SELECTOR = Web3.keccak(text="exchange(int128,int128,uint256,uint256)")[:4]
+CURVE_V1_EXCHANGE_UNDERLYING_SELECTOR = Web3.keccak(
+    text="exchange_underlying(int128,int128,uint256,uint256)"
+)[:4]
+
 SwapAmount: TypeAlias = (
     CurveStableSwapPoolSwapAmounts | UniswapV2PoolSwapAmounts | UniswapV3PoolSwapAmounts
 )
@@ -710,7 +722,7 @@ class UniswapCurveCycle(Subscriber, BaseArbitrage):
                         # address
                         self.input_token.address,
                         # bytes calldata
-                        Web3.keccak(text="transfer(address,uint256)")[:4]
+                        ERC20_TRANSFER_SELECTOR
                         + eth_abi.abi.encode(
                             types=(
                                 "address",
@@ -770,7 +782,7 @@ class UniswapCurveCycle(Subscriber, BaseArbitrage):
                             # address
                             swap_pool.address,
                             # bytes calldata
-                            Web3.keccak(text="swap(uint256,uint256,address,bytes)")[:4]
+                            UNISWAP_V2_SWAP_SELECTOR
                             + eth_abi.abi.encode(
                                 types=(
                                     "uint256",
@@ -807,7 +819,7 @@ class UniswapCurveCycle(Subscriber, BaseArbitrage):
                             # address
                             swap_pool.address,
                             # bytes calldata
-                            Web3.keccak(text="swap(address,bool,int256,uint160,bytes)")[:4]
+                            UNISWAP_V3_SWAP_SELECTOR
                             + eth_abi.abi.encode(
                                 types=(
                                     "address",
@@ -855,7 +867,7 @@ class UniswapCurveCycle(Subscriber, BaseArbitrage):
                                 # address
                                 _swap_amounts.token_in.address,
                                 # bytes calldata
-                                Web3.keccak(text="approve(address,uint256)")[:4]
+                                ERC20_APPROVE_SELECTOR
                                 + eth_abi.abi.encode(
                                     types=["address", "uint256"],
                                     args=[swap_pool.address, amount_to_approve],
@@ -873,9 +885,7 @@ class UniswapCurveCycle(Subscriber, BaseArbitrage):
                                 # address
                                 swap_pool.address,
                                 # bytes calldata
-                                Web3.keccak(
-                                    text="exchange_underlying(int128,int128,uint256,uint256)"
-                                )[:4]
+                                CURVE_V1_EXCHANGE_UNDERLYING_SELECTOR
                                 + eth_abi.abi.encode(
                                     types=["int128", "int128", "uint256", "uint256"],
                                     args=[
@@ -894,7 +904,7 @@ class UniswapCurveCycle(Subscriber, BaseArbitrage):
                                 # address
                                 swap_pool.address,
                                 # bytes calldata
-                                Web3.keccak(text="exchange(int128,int128,uint256,uint256)")[:4]
+                                CURVE_V1_EXCHANGE_SELECTOR
                                 + eth_abi.abi.encode(
                                     types=["int128", "int128", "uint256", "uint256"],
                                     args=[
@@ -919,7 +929,7 @@ class UniswapCurveCycle(Subscriber, BaseArbitrage):
                                 # address
                                 _swap_amounts.token_out.address,
                                 # bytes calldata
-                                Web3.keccak(text="transfer(address,uint256)")[:4]
+                                ERC20_TRANSFER_SELECTOR
                                 + eth_abi.abi.encode(
                                     types=(
                                         "address",
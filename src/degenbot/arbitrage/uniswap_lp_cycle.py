@@ -7,9 +7,13 @@ import eth_abi.abi
 from eth_typing import ChecksumAddress
 from eth_utils.address import to_checksum_address
 from scipy.optimize import OptimizeResult, minimize_scalar
-from web3 import Web3
 
 from ..baseclasses import BaseArbitrage, PlaintextMessage, Publisher, Subscriber
+from ..constants import (
+    ERC20_TRANSFER_SELECTOR,
+    UNISWAP_V2_SWAP_SELECTOR,
+    UNISWAP_V3_SWAP_SELECTOR,
+)
 from ..erc20_token import Erc20Token
 from ..exceptions import ArbitrageError, EVMRevertError, LiquidityPoolError, ZeroLiquidityError
 from ..logging import logger
@@ -722,7 +726,7 @@ class UniswapLpCycle(Subscriber, BaseArbitrage):
                         # address
                         self.input_token.address,
                         # bytes calldata
-                        Web3.keccak(text="transfer(address,uint256)")[:4]
+                        ERC20_TRANSFER_SELECTOR
                         + eth_abi.abi.encode(
                             types=(
                                 "address",
@@ -773,7 +777,7 @@ class UniswapLpCycle(Subscriber, BaseArbitrage):
                                 # address
                                 swap_pool.address,
                                 # bytes calldata
-                                Web3.keccak(text="swap(uint256,uint256,address,bytes)")[:4]
+                                UNISWAP_V2_SWAP_SELECTOR
                                 + eth_abi.abi.encode(
                                     types=(
                                         "uint256",
@@ -804,7 +808,7 @@ class UniswapLpCycle(Subscriber, BaseArbitrage):
                                 # address
                                 swap_pool.address,
                                 # bytes calldata
-                                Web3.keccak(text="swap(address,bool,int256,uint160,bytes)")[:4]
+                                UNISWAP_V3_SWAP_SELECTOR
                                 + eth_abi.abi.encode(
                                     types=(
                                         "address",
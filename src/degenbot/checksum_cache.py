@@ -0,0 +1,22 @@
+from functools import lru_cache
+
+from eth_typing import AnyAddress, ChecksumAddress
+from eth_utils.address import to_checksum_address
+
+
+@lru_cache(maxsize=65536)
+def _get_checksum_address(address: AnyAddress | str | bytes) -> ChecksumAddress:
+    return to_checksum_address(address)
+
+
+def get_checksum_address(address: AnyAddress | str | bytes) -> ChecksumAddress:
+    """
+    Get the EIP-55 checksummed form of an address.
+
+    Results are memoized, so repeated lookups for a known address skip the keccak256 hash. String
+    inputs are normalized to lowercase before lookup, so differently-cased inputs share an entry.
+    """
+
+    if isinstance(address, str):
+        address = address.lower()
+    return _get_checksum_address(address)
@@ -2,6 +2,7 @@ from typing import Dict
 
 from eth_typing import ChecksumAddress
 from eth_utils.address import to_checksum_address
+from web3 import Web3
 
 
 def _min_uint(_: int) -> int:
@@ -49,6 +50,11 @@ MAX_UINT256 = _max_uint(256)
 
 ZERO_ADDRESS: ChecksumAddress = to_checksum_address("0x0000000000000000000000000000000000000000")
 
+# Function selectors used to build arbitrage payload calldata
+ERC20_TRANSFER_SELECTOR = Web3.keccak(text="transfer(address,uint256)")[:4]
+UNISWAP_V2_SWAP_SELECTOR = Web3.keccak(text="swap(uint256,uint256,address,bytes)")[:4]
+UNISWAP_V3_SWAP_SELECTOR = Web3.keccak(text="swap(address,bool,int256,uint160,bytes)")[:4]
+
 
 # Contract addresses for the native blockchain token, keyed by chain ID
 WRAPPED_NATIVE_TOKENS: Dict[int, ChecksumAddress] = {
@@ -2,10 +2,10 @@ from threading import Lock
 from typing import Any, Dict
 
 from eth_typing import ChecksumAddress
-from eth_utils.address import to_checksum_address
 
 from .. import config
 from ..baseclasses import BaseManager
+from ..checksum_cache import get_checksum_address
 from ..erc20_token import EEEEEEEEEEEEEEEEEEEEEEEEEEEEEEEEEEEEEEEE, Erc20Token
 from ..exceptions import ManagerError
 
@@ -46,7 +46,7 @@ class Erc20TokenHelperManager(BaseManager):
         Get the token object from its address
         """
 
-        address = to_checksum_address(address)
+        address = get_checksum_address(address)
 
         if token_helper := self._erc20tokens.get(address):
             return token_helper
@@ -1,9 +1,9 @@
 from typing import Dict
 
 from eth_typing import ChecksumAddress
-from eth_utils.address import to_checksum_address
 
 from ..baseclasses import BaseLiquidityPool
+from ..checksum_cache import get_checksum_address
 from ..logging import logger
 
 # Internal state dictionary that maintains a keyed dictionary of all pool objects. The top level
@@ -27,21 +27,21 @@ class AllPools:
         if isinstance(pool, BaseLiquidityPool):
             _pool_address = pool.address
         else:
-            _pool_address = to_checksum_address(pool)
+            _pool_address = get_checksum_address(pool)
         return _pool_address in self.pools
 
     def __delitem__(self, pool: BaseLiquidityPool | str) -> None:
         if isinstance(pool, BaseLiquidityPool):
             _pool_address = pool.address
         else:
-            _pool_address = to_checksum_address(pool)
+            _pool_address = get_checksum_address(pool)
         del self.pools[_pool_address]
 
     def __getitem__(self, pool_address: str) -> BaseLiquidityPool:
-        return self.pools[to_checksum_address(pool_address)]
+        return self.pools[get_checksum_address(pool_address)]
 
     def __setitem__(self, pool_address: str, pool_helper: BaseLiquidityPool) -> None:
-        _pool_address = to_checksum_address(pool_address)
+        _pool_address = get_checksum_address(pool_address)
         if _pool_address in self.pools:  # pragma: no cover
             logger.warning(
                 f"Pool with address {_pool_address} already known. It has been overwritten."
@@ -52,4 +52,4 @@ class AllPools:
         return len(self.pools)
 
     def get(self, pool_address: str) -> BaseLiquidityPool | None:
-        return self.pools.get(to_checksum_address(pool_address))
+        return self.pools.get(get_checksum_address(pool_address))
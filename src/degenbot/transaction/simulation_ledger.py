@@ -1,8 +1,8 @@
 from typing import Dict
 
 from eth_typing import ChecksumAddress
-from eth_utils.address import to_checksum_address
 
+from ..checksum_cache import get_checksum_address
 from ..logging import logger
 from ..erc20_token import Erc20Token
 
@@ -61,9 +61,9 @@ class SimulationLedger:
         if isinstance(token, Erc20Token):
             _token_address = token.address
         else:
-            _token_address = to_checksum_address(token)
+            _token_address = get_checksum_address(token)
 
-        _address = to_checksum_address(address)
+        _address = get_checksum_address(address)
 
         address_balance: Dict[ChecksumAddress, int]
         try:
@@ -113,12 +113,12 @@ class SimulationLedger:
             If inputs did not match the expected types.
         """
 
-        _address = to_checksum_address(address)
+        _address = get_checksum_address(address)
 
         if isinstance(token, Erc20Token):
             _token_address = token.address
         else:
-            _token_address = to_checksum_address(token)
+            _token_address = get_checksum_address(token)
 
         address_balances: Dict[ChecksumAddress, int]
         try:
@@ -164,7 +164,7 @@ class SimulationLedger:
         if isinstance(token, Erc20Token):
             _token_address = token.address
         else:
-            _token_address = to_checksum_address(token)
+            _token_address = get_checksum_address(token)
 
         self.adjust(
             address=from_addr,
@@ -7,12 +7,12 @@ from typing import TYPE_CHECKING, Any, Dict, List, Set, Tuple, cast
 
 import eth_abi.abi
 from eth_typing import BlockNumber, ChainId, ChecksumAddress
-from eth_utils.address import to_checksum_address
 from hexbytes import HexBytes
 from web3 import Web3
 
 from .. import config
 from ..baseclasses import BaseSimulationResult, BaseTransaction
+from ..checksum_cache import get_checksum_address
 from ..constants import WRAPPED_NATIVE_TOKENS
 from ..erc20_token import Erc20Token
 from ..exceptions import (
@@ -42,56 +42,56 @@ _ROUTERS: Dict[
 ]
 _ROUTERS = {
     ChainId.ETH: {
-        to_checksum_address("0xd9e1cE17f2641f24aE83637ab66a2cca9C378B9F"): {
+        get_checksum_address("0xd9e1cE17f2641f24aE83637ab66a2cca9C378B9F"): {
             "name": "Sushiswap: Router",
             "factory_address": {
-                2: to_checksum_address("0xC0AEe478e3658e2610c5F7A4A2E1777cE9e4f2Ac")
+                2: get_checksum_address("0xC0AEe478e3658e2610c5F7A4A2E1777cE9e4f2Ac")
             },
         },
-        to_checksum_address("0xf164fC0Ec4E93095b804a4795bBe1e041497b92a"): {
+        get_checksum_address("0xf164fC0Ec4E93095b804a4795bBe1e041497b92a"): {
             "name": "UniswapV2: Router",
             "factory_address": {
-                2: to_checksum_address("0x5C69bEe701ef814a2B6a3EDD4B1652CB9cc5aA6f")
+                2: get_checksum_address("0x5C69bEe701ef814a2B6a3EDD4B1652CB9cc5aA6f")
             },
         },
-        to_checksum_address("0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D"): {
+        get_checksum_address("0x7a250d5630B4cF539739dF2C5dAcb4c659F2488D"): {
             "name": "UniswapV2: Router 2",
             "factory_address": {
-                2: to_checksum_address("0x5C69bEe701ef814a2B6a3EDD4B1652CB9cc5aA6f")
+                2: get_checksum_address("0x5C69bEe701ef814a2B6a3EDD4B1652CB9cc5aA6f")
             },
         },
-        to_checksum_address("0xE592427A0AEce92De3Edee1F18E0157C05861564"): {
+        get_checksum_address("0xE592427A0AEce92De3Edee1F18E0157C05861564"): {
             "name": "UniswapV3: Router",
             "factory_address": {
-                3: to_checksum_address("0x1F98431c8aD98523631AE4a59f267346ea31F984")
+                3: get_checksum_address("0x1F98431c8aD98523631AE4a59f267346ea31F984")
             },
         },
-        to_checksum_address("0x68b3465833fb72A70ecDF485E0e4C7bD8665Fc45"): {
+        get_checksum_address("0x68b3465833fb72A70ecDF485E0e4C7bD8665Fc45"): {
             "name": "UniswapV3: Router 2",
             "factory_address": {
-                2: to_checksum_address("0x5C69bEe701ef814a2B6a3EDD4B1652CB9cc5aA6f"),
-                3: to_checksum_address("0x1F98431c8aD98523631AE4a59f267346ea31F984"),
+                2: get_checksum_address("0x5C69bEe701ef814a2B6a3EDD4B1652CB9cc5aA6f"),
+                3: get_checksum_address("0x1F98431c8aD98523631AE4a59f267346ea31F984"),
             },
         },
-        to_checksum_address("0xEf1c6E67703c7BD7107eed8303Fbe6EC2554BF6B"): {
+        get_checksum_address("0xEf1c6E67703c7BD7107eed8303Fbe6EC2554BF6B"): {
             "name": "Uniswap Universal Router",
             "factory_address": {
-                2: to_checksum_address("0x5C69bEe701ef814a2B6a3EDD4B1652CB9cc5aA6f"),
-                3: to_checksum_address("0x1F98431c8aD98523631AE4a59f267346ea31F984"),
+                2: get_checksum_address("0x5C69bEe701ef814a2B6a3EDD4B1652CB9cc5aA6f"),
+                3: get_checksum_address("0x1F98431c8aD98523631AE4a59f267346ea31F984"),
             },
         },
-        to_checksum_address("0x3fC91A3afd70395Cd496C647d5a6CC9D4B2b7FAD"): {
+        get_checksum_address("0x3fC91A3afd70395Cd496C647d5a6CC9D4B2b7FAD"): {
             "name": "Universal Universal Router (V1_2)",
             "factory_address": {
-                2: to_checksum_address("0x5C69bEe701ef814a2B6a3EDD4B1652CB9cc5aA6f"),
-                3: to_checksum_address("0x1F98431c8aD98523631AE4a59f267346ea31F984"),
+                2: get_checksum_address("0x5C69bEe701ef814a2B6a3EDD4B1652CB9cc5aA6f"),
+                3: get_checksum_address("0x1F98431c8aD98523631AE4a59f267346ea31F984"),
             },
         },
-        to_checksum_address("0x3F6328669a86bef431Dc6F9201A5B90F7975a023"): {
+        get_checksum_address("0x3F6328669a86bef431Dc6F9201A5B90F7975a023"): {
             "name": "Universal Universal Router (V1_3)",
             "factory_address": {
-                2: to_checksum_address("0x5C69bEe701ef814a2B6a3EDD4B1652CB9cc5aA6f"),
-                3: to_checksum_address("0x1F98431c8aD98523631AE4a59f267346ea31F984"),
+                2: get_checksum_address("0x5C69bEe701ef814a2B6a3EDD4B1652CB9cc5aA6f"),
+                3: get_checksum_address("0x1F98431c8aD98523631AE4a59f267346ea31F984"),
             },
         },
     }
@@ -100,9 +100,9 @@ _ROUTERS = {
 
 class UniversalRouterSpecialAddress:
     # ref: https://github.com/Uniswap/universal-router/blob/deployed-commit/contracts/libraries/Constants.sol
-    ETH = to_checksum_address("0x0000000000000000000000000000000000000000")
-    MSG_SENDER = to_checksum_address("0x0000000000000000000000000000000000000001")
-    ROUTER = to_checksum_address("0x0000000000000000000000000000000000000002")
+    ETH = get_checksum_address("0x0000000000000000000000000000000000000000")
+    MSG_SENDER = get_checksum_address("0x0000000000000000000000000000000000000001")
+    ROUTER = get_checksum_address("0x0000000000000000000000000000000000000002")
 
 
 class UniversalRouterSpecialValues:
@@ -114,11 +114,11 @@ class UniversalRouterSpecialValues:
 class V3RouterSpecialAddress:
     # SwapRouter.sol checks for address(0)
     # ref: https://github.com/Uniswap/v3-periphery/blob/main/contracts/SwapRouter.sol
-    ROUTER_1 = to_checksum_address("0x0000000000000000000000000000000000000000")
+    ROUTER_1 = get_checksum_address("0x0000000000000000000000000000000000000000")
 
     # ref: https://github.com/Uniswap/swap-router-contracts/blob/main/contracts/libraries/Constants.sol
-    MSG_SENDER = to_checksum_address("0x0000000000000000000000000000000000000001")
-    ROUTER_2 = to_checksum_address("0x0000000000000000000000000000000000000002")
+    MSG_SENDER = get_checksum_address("0x0000000000000000000000000000000000000001")
+    ROUTER_2 = get_checksum_address("0x0000000000000000000000000000000000000002")
 
 
 class V3RouterSpecialValues:
@@ -158,7 +158,7 @@ class UniswapTransaction(BaseTransaction):
                 }
             }
         """
-        router_address = to_checksum_address(router_address)
+        router_address = get_checksum_address(router_address)
 
         for key in [
             "name",
@@ -180,7 +180,7 @@ class UniswapTransaction(BaseTransaction):
         The method checksums the token address.
         """
 
-        _token_address = to_checksum_address(token_address)
+        _token_address = get_checksum_address(token_address)
 
         try:
             WRAPPED_NATIVE_TOKENS[chain_id]
@@ -227,10 +227,10 @@ class UniswapTransaction(BaseTransaction):
 
         self.chain_id = int(chain_id, 16) if isinstance(chain_id, str) else chain_id
         self.routers = _ROUTERS[self.chain_id]
-        self.sender = to_checksum_address(tx_sender)
+        self.sender = get_checksum_address(tx_sender)
         self.recipients: Set[ChecksumAddress] = set()
 
-        router_address = to_checksum_address(router_address)
+        router_address = get_checksum_address(router_address)
         if router_address not in self.routers:
             raise ValueError(f"Router address {router_address} unknown!")
 
@@ -392,7 +392,7 @@ class UniswapTransaction(BaseTransaction):
         )
 
         if last_swap:
-            self.recipients.add(to_checksum_address(recipient))
+            self.recipients.add(get_checksum_address(recipient))
 
         if last_swap and amount_out_min is not None and _amount_out < amount_out_min:
             raise TransactionError(
@@ -490,7 +490,7 @@ class UniswapTransaction(BaseTransaction):
 
         silent = self.silent
 
-        self.recipients.add(to_checksum_address(recipient))
+        self.recipients.add(get_checksum_address(recipient))
 
         if token_in not in pool.tokens:
             raise ValueError(f"Token {token_in} not found in pool {pool}")
@@ -578,7 +578,7 @@ class UniswapTransaction(BaseTransaction):
 
         silent = self.silent
 
-        self.recipients.add(to_checksum_address(recipient))
+        self.recipients.add(get_checksum_address(recipient))
 
         if token_in not in pool.tokens:
             raise ValueError(f"Token {token_in} not found in pool {pool}")
@@ -649,7 +649,7 @@ class UniswapTransaction(BaseTransaction):
                 ):
                     _recipient = self.router_address
                 case _:
-                    _recipient = to_checksum_address(recipient)
+                    _recipient = get_checksum_address(recipient)
                     self.recipients.add(_recipient)
 
             self.ledger.transfer(
@@ -942,7 +942,7 @@ class UniswapTransaction(BaseTransaction):
                             self.router_address,
                             _pay_portion_recipient,
                         )
-                        self.recipients.add(to_checksum_address(_pay_portion_recipient))
+                        self.recipients.add(get_checksum_address(_pay_portion_recipient))
 
                 case "WRAP_ETH":
                     """
@@ -971,7 +971,7 @@ class UniswapTransaction(BaseTransaction):
                         case UniversalRouterSpecialAddress.MSG_SENDER:
                             _recipient = self.sender
                         case _:
-                            _recipient = to_checksum_address(_tx_recipient)
+                            _recipient = get_checksum_address(_tx_recipient)
 
                     # if tx_recipient == UniversalRouterSpecialAddress.ROUTER:
                     #     _recipient = self.router_address
@@ -1629,8 +1629,8 @@ class UniswapTransaction(BaseTransaction):
                         logger.debug(f"{func_name}: {self.hash.hex()=}")
 
                         if func_name == "addLiquidity":
-                            tx_token_a = to_checksum_address(func_params["tokenA"])
-                            tx_token_b = to_checksum_address(func_params["tokenB"])
+                            tx_token_a = get_checksum_address(func_params["tokenA"])
+                            tx_token_b = get_checksum_address(func_params["tokenB"])
                             tx_token_amount_a = func_params["amountADesired"]
                             tx_token_amount_b = func_params["amountBDesired"]
                             tx_token_amount_a_min = func_params["amountAMin"]  # noqa: F841
@@ -1646,7 +1646,7 @@ class UniswapTransaction(BaseTransaction):
                                 else (tx_token_amount_b, tx_token_amount_a)
                             )
                         elif func_name == "addLiquidityETH":
-                            tx_token = to_checksum_address(func_params["token"])
+                            tx_token = get_checksum_address(func_params["token"])
                             tx_token_amount = func_params["amountTokenDesired"]
                             tx_token_amount_min = func_params["amountTokenMin"]  # noqa: F841
                             tx_eth_min = func_params["amountETHMin"]
@@ -2334,7 +2334,7 @@ class UniswapTransaction(BaseTransaction):
                         logger.info(f"{amount1_desired=}")
 
                         positions_contract = config.get_web3().eth.contract(
-                            address=to_checksum_address(
+                            address=get_checksum_address(
                                 "0xC36442b4a4522E871399CD717aBDD847Ab11FE88"
                             ),
                             abi=json.loads(
@@ -2,11 +2,11 @@ from threading import Lock
 from typing import TYPE_CHECKING, Any, Dict, List, Set, Tuple
 
 from eth_typing import ChecksumAddress
-from eth_utils.address import to_checksum_address
 from web3.contract.contract import Contract
 
 from .. import config
 from ..baseclasses import BaseManager
+from ..checksum_cache import get_checksum_address
 from ..constants import ZERO_ADDRESS
 from ..dex.uniswap import FACTORY_ADDRESSES, TICKLENS_ADDRESSES
 from ..erc20_token import Erc20Token
@@ -71,8 +71,8 @@ class UniswapLiquidityPoolManager(BaseManager):
         cls.add_chain(chain_id=chain_id)
         cls.add_factory(chain_id=chain_id, factory_address=factory_address)
 
-        ticklens_address = to_checksum_address(ticklens_address)
-        factory_address = to_checksum_address(factory_address)
+        ticklens_address = get_checksum_address(ticklens_address)
+        factory_address = get_checksum_address(factory_address)
         if factory_address not in TICKLENS_ADDRESSES[chain_id]:
             TICKLENS_ADDRESSES[chain_id][factory_address] = ticklens_address
 
@@ -83,7 +83,7 @@ class UniswapLiquidityPoolManager(BaseManager):
         """
         cls.add_chain(chain_id=chain_id)
 
-        factory_address = to_checksum_address(factory_address)
+        factory_address = get_checksum_address(factory_address)
         if factory_address not in FACTORY_ADDRESSES[chain_id]:
             FACTORY_ADDRESSES[chain_id][factory_address] = {}
 
@@ -93,7 +93,7 @@ class UniswapLiquidityPoolManager(BaseManager):
         Add a pool_init_hash for a factory at a given chain ID.
         """
 
-        factory_address = to_checksum_address(factory_address)
+        factory_address = get_checksum_address(factory_address)
 
         cls.add_factory(chain_id=chain_id, factory_address=factory_address)
 
@@ -116,7 +116,7 @@ class UniswapV2LiquidityPoolManager(UniswapLiquidityPoolManager):
     ):
         chain_id = chain_id if chain_id is not None else config.get_web3().eth.chain_id
 
-        factory_address = to_checksum_address(factory_address)
+        factory_address = get_checksum_address(factory_address)
 
         if factory_address not in FACTORY_ADDRESSES[chain_id]:
             raise ManagerError(
@@ -153,7 +153,7 @@ class UniswapV2LiquidityPoolManager(UniswapLiquidityPoolManager):
         if isinstance(pool, LiquidityPool):
             pool_address = pool.address
         else:
-            pool_address = to_checksum_address(pool)
+            pool_address = get_checksum_address(pool)
 
         try:
             del self._tracked_pools[pool_address]
@@ -195,7 +195,7 @@ class UniswapV2LiquidityPoolManager(UniswapLiquidityPoolManager):
                 raise ValueError("Provide exactly two token addresses")
 
             checksummed_token_addresses = tuple(
-                [to_checksum_address(token_address) for token_address in token_addresses]
+                [get_checksum_address(token_address) for token_address in token_addresses]
             )
 
             try:
@@ -207,7 +207,7 @@ class UniswapV2LiquidityPoolManager(UniswapLiquidityPoolManager):
             except Exception:
                 raise ManagerError("Could not get both Erc20Token helpers")
 
-            pool_address = to_checksum_address(
+            pool_address = get_checksum_address(
                 self._w3_contract.functions.getPair(*checksummed_token_addresses).call()
             )
             if pool_address == ZERO_ADDRESS:
@@ -216,7 +216,7 @@ class UniswapV2LiquidityPoolManager(UniswapLiquidityPoolManager):
         if TYPE_CHECKING:
             assert pool_address is not None
         # Address is now known, check if the pool is already being tracked
-        pool_address = to_checksum_address(pool_address)
+        pool_address = get_checksum_address(pool_address)
 
         if pool_address in self._untracked_pools:
             raise PoolNotAssociated(
@@ -278,10 +278,10 @@ class UniswapV3LiquidityPoolManager(UniswapLiquidityPoolManager):
     ):
         chain_id = chain_id if chain_id is not None else config.get_web3().eth.chain_id
 
-        factory_address = to_checksum_address(factory_address)
+        factory_address = get_checksum_address(factory_address)
 
         if deployer_address is not None:
-            deployer_address = to_checksum_address(deployer_address)
+            deployer_address = get_checksum_address(deployer_address)
         else:
             deployer_address = factory_address
 
@@ -325,7 +325,7 @@ class UniswapV3LiquidityPoolManager(UniswapLiquidityPoolManager):
         if isinstance(pool, V3LiquidityPool):
             pool_address = pool.address
         else:
-            pool_address = to_checksum_address(pool)
+            pool_address = get_checksum_address(pool)
 
         try:
             del self._tracked_pools[pool_address]
@@ -441,7 +441,7 @@ class UniswapV3LiquidityPoolManager(UniswapLiquidityPoolManager):
             # print(f"building V3 pool from address")
             if token_addresses is not None or pool_fee is not None:
                 raise ValueError("Conflicting arguments provided. Pass address OR tokens+fee")
-            pool_address = to_checksum_address(pool_address)
+            pool_address = get_checksum_address(pool_address)
         elif token_addresses is not None and pool_fee is not None:
             # print(f"building V3 pool from address and fee")
             if len(token_addresses) != 2:
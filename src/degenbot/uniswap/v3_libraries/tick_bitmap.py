@@ -1,4 +1,3 @@
-from decimal import Decimal
 from typing import Dict, Tuple
 
 from ...constants import MAX_UINT8
@@ -17,7 +16,7 @@ def flipTick(
     if not (tick % tick_spacing == 0):
         raise EVMRevertError("Tick not correctly spaced!")
 
-    word_pos, bit_pos = position(int(Decimal(tick) // tick_spacing))
+    word_pos, bit_pos = position(tick // tick_spacing)
     logger.debug(f"Flipping {tick=} @ {word_pos=}, {bit_pos=}")
 
     try:
@@ -32,7 +31,7 @@ def flipTick(
 
 def position(tick: int) -> Tuple[int, int]:
     word_pos: int = tick >> 8
-    bit_pos: int = tick % 256
+    bit_pos: int = tick & 0xFF
     return (word_pos, bit_pos)
 
 
@@ -42,11 +41,10 @@ def nextInitializedTickWithinOneWord(
     tick_spacing: int,
     less_than_or_equal: bool,
 ) -> Tuple[int, bool]:
-    compressed = int(
-        Decimal(tick) // tick_spacing
-    )  # tick can be negative, use Decimal so floor division rounds to zero instead of negative infinity
-    if tick < 0 and tick % tick_spacing != 0:
-        compressed -= 1  # round towards negative infinity
+    # Solidity division truncates towards zero, and the contract then decrements negative ticks
+    # that are not evenly spaced. Python floor division rounds towards negative infinity, which
+    # gives the same result in a single step.
+    compressed = tick // tick_spacing
 
     if less_than_or_equal:
         word_pos, bit_pos = position(compressed)
@@ -2,16 +2,17 @@
 
 
 from io import TextIOWrapper
+from operator import attrgetter
 from typing import Any, Dict, List, TextIO, Tuple
 
 import ujson
 from eth_typing import ChecksumAddress
-from eth_utils.address import to_checksum_address
 from web3 import Web3
 from web3._utils.events import get_event_data
 from web3._utils.filters import construct_event_filter_params
 
 from .. import config
+from ..checksum_cache import get_checksum_address
 from ..logging import logger
 from .abi import UNISWAP_V3_POOL_ABI
 from .v3_dataclasses import (
@@ -50,7 +51,7 @@ class UniswapV3LiquiditySnapshot:
         self.newest_block = json_liquidity_snapshot.pop("snapshot_block")
 
         self._liquidity_snapshot: Dict[ChecksumAddress, Dict[str, Any]] = {
-            to_checksum_address(pool_address): {
+            get_checksum_address(pool_address): {
                 "tick_bitmap": {
                     int(k): UniswapV3BitmapAtWord(**v)
                     for k, v in pool_liquidity_snapshot["tick_bitmap"].items()
@@ -88,7 +89,7 @@ class UniswapV3LiquiditySnapshot:
         def _process_log() -> Tuple[ChecksumAddress, UniswapV3LiquidityEvent]:
             decoded_event = get_event_data(config.get_web3().codec, event_abi, log)
 
-            pool_address = to_checksum_address(decoded_event["address"])
+            pool_address = get_checksum_address(decoded_event["address"])
             tx_index = decoded_event["transactionIndex"]
             liquidity_block = decoded_event["blockNumber"]
             liquidity = decoded_event["args"]["amount"] * (
@@ -144,7 +145,7 @@ class UniswapV3LiquiditySnapshot:
         self.newest_block = to_block
 
     def get_new_liquidity_updates(self, pool_address: str) -> List[UniswapV3PoolExternalUpdate]:
-        pool_address = to_checksum_address(pool_address)
+        pool_address = get_checksum_address(pool_address)
         pool_updates = self._liquidity_events.get(pool_address, list())
         self._liquidity_events[pool_address] = list()
 
@@ -152,7 +153,7 @@ class UniswapV3LiquiditySnapshot:
         # they must be applied in chronological order
         sorted_events = sorted(
             pool_updates,
-            key=lambda event: (event.block_number, event.tx_index),
+            key=attrgetter("block_number", "tx_index"),
         )
 
         return [
@@ -168,7 +169,7 @@ class UniswapV3LiquiditySnapshot:
         ]
 
     def get_tick_bitmap(self, pool: ChecksumAddress | str) -> Dict[int, UniswapV3BitmapAtWord]:
-        pool_address = to_checksum_address(pool)
+        pool_address = get_checksum_address(pool)
 
         try:
             tick_bitmap: Dict[int, UniswapV3BitmapAtWord] = self._liquidity_snapshot[pool_address][
@@ -179,7 +180,7 @@ class UniswapV3LiquiditySnapshot:
             return dict()
 
     def get_tick_data(self, pool: ChecksumAddress | str) -> Dict[int, UniswapV3LiquidityAtTick]:
-        pool_address = to_checksum_address(pool)
+        pool_address = get_checksum_address(pool)
 
         try:
             tick_data: Dict[int, UniswapV3LiquidityAtTick] = self._liquidity_snapshot[pool_address][
@@ -195,7 +196,7 @@ class UniswapV3LiquiditySnapshot:
         tick_data: Dict[int, UniswapV3LiquidityAtTick],
         tick_bitmap: Dict[int, UniswapV3BitmapAtWord],
     ) -> None:
-        pool_address = to_checksum_address(pool)
+        pool_address = get_checksum_address(pool)
 
         self._add_pool_if_missing(pool_address)
         self._liquidity_snapshot[pool_address].update(
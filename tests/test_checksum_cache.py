@@ -0,0 +1,20 @@
+from degenbot.checksum_cache import get_checksum_address
+from eth_utils.address import to_checksum_address
+from hexbytes import HexBytes
+
+WETH_ADDRESS = "0xC02aaA39b223FE8D0A0e5C4F27eAD9083C756Cc2"
+
+
+def test_checksum_address_matches_eth_utils():
+    addresses: list[str | bytes] = [
+        WETH_ADDRESS,
+        WETH_ADDRESS.lower(),
+        WETH_ADDRESS.upper().replace("0X", "0x"),
+        HexBytes(WETH_ADDRESS),
+    ]
+    for address in addresses:
+        assert get_checksum_address(address) == to_checksum_address(address) == WETH_ADDRESS
+
+
+def test_checksum_address_is_cached():
+    assert get_checksum_address(WETH_ADDRESS) is get_checksum_address(WETH_ADDRESS.lower())
@@ -36,6 +36,11 @@ def empty_sparse_bitmap() -> dict[int, Any]:
     return dict()
 
 
+def test_position():
+    for tick in [TickMath.MIN_TICK, -257, -256, -255, -1, 0, 1, 255, 256, 257, TickMath.MAX_TICK]:
+        assert TickBitmap.position(tick) == (tick >> 8, tick % 256)
+
+
 def test_isInitialized():
     tick_bitmap = empty_full_bitmap()
 
@@ -284,3 +289,32 @@ def test_nextInitializedTickWithinOneWord() -> None:
         tick_spacing=1,
         less_than_or_equal=True,
     )
+
+
+def test_nextInitializedTickWithinOneWord_rounds_negative_ticks_down() -> None:
+    tick_spacing = 60
+    tick_bitmap = {word: UniswapV3BitmapAtWord() for word in range(-2, 2)}
+    for tick in [-120, 60]:
+        TickBitmap.flipTick(tick_bitmap=tick_bitmap, tick=tick, tick_spacing=tick_spacing)
+
+    # -61 compresses to -2 (rounded towards negative infinity), not -1
+    assert TickBitmap.nextInitializedTickWithinOneWord(
+        tick_bitmap=tick_bitmap,
+        tick=-61,
+        tick_spacing=tick_spacing,
+        less_than_or_equal=True,
+    ) == (-120, True)
+    assert TickBitmap.nextInitializedTickWithinOneWord(
+        tick_bitmap=tick_bitmap,
+        tick=-61,
+        tick_spacing=tick_spacing,
+        less_than_or_equal=False,
+    ) == (-60, False)
+
+    # -1 compresses to -1, so the search to the right starts at compressed tick 0
+    assert TickBitmap.nextInitializedTickWithinOneWord(
+        tick_bitmap=tick_bitmap,
+        tick=-1,
+        tick_spacing=tick_spacing,
+        less_than_or_equal=False,
+    ) == (60, True)